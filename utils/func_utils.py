@@ -1,9 +1,59 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv
 import requests
+import shelve
 import unicodedata
-from unidecode import unidecode
+from concurrent.futures import ThreadPoolExecutor
 from geopy.geocoders import Nominatim
 from geopy.extra.rate_limiter import RateLimiter
+from joblib import Parallel, delayed
+
+
+def _normalize_string(text):
+    """
+    Remove accents and normalize the case of a given string.
+
+    Accents are stripped by decomposing the string to NFKD form and
+    dropping the combining marks, which covers the Latin accents
+    found in the Spanish municipio/departamento names.
+
+    Parameters:
+    text (str): The string to be processed.
+
+    Returns:
+    str: The processed string without accents, lowercased and capitalized.
+    """
+    if isinstance(text, str):
+        decomposed = unicodedata.normalize('NFKD', text)
+        return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower().capitalize()
+    else:
+        return text
+
+
+def _normalize_string_column(series):
+    """
+    Normalizes the accents and case of a string Series.
+
+    Deduplicates so normalization runs once per unique value instead of
+    once per row, then maps the results back. Columns that are already
+    normalized are returned as-is, so idempotent reruns skip the per-row
+    map entirely.
+
+    Parameters:
+    series (pandas.Series): The object-dtype Series to be normalized.
+
+    Returns:
+    pandas.Series: The normalized Series.
+    """
+    mapping = {value: _normalize_string(value) for value in series.dropna().unique()}
+
+    # Checking the unique values covers the whole column at k << n cost
+    if all(value == normalized for value, normalized in mapping.items()):
+        return series
+
+    # map falls back to object dtype, so restore the column's own dtype
+    return series.map(mapping).astype(series.dtype)
 
 
 class DataGovAPI:
@@ -26,16 +76,18 @@ class DataGovAPI:
         """
         Loads data from the endpoint URL into a pandas DataFrame.
         
-        This method sends a GET request to the endpoint URL, checks for a successful response,
-        and converts the JSON content of the response into a pandas DataFrame. If an error occurs,
+        This method streams a GET request to the endpoint URL, checks for a successful response,
+        and parses the JSON bytes of the response directly into a pandas DataFrame. If an error occurs,
         it catches the exception and prints an error message.
         """
         try:
-            response = requests.get(endpoint)
-            response.raise_for_status()  # Raise an HTTPError for bad responses
+            with requests.get(endpoint, stream=True) as response:
+                response.raise_for_status()  # Raise an HTTPError for bad responses
 
-            # Convert downloaded content to a pandas DataFrame
-            self.dataframe = pd.read_json(response.text)
+                # Feed the raw byte stream straight into the JSON parser instead of
+                # materializing (and decoding) the whole payload as response.text
+                response.raw.decode_content = True
+                self.dataframe = pd.read_json(response.raw, dtype_backend="pyarrow")
             print('Data loaded successfully.')
         except Exception as e:
             print('Error loading data: ', e)
@@ -57,10 +109,11 @@ class DataManager:
     """
     A class to manage a pandas DataFrame, including saving it to a CSV file.
     """
-    def __init__(self):
+    def __init__(self, geocode_cache_path='geocode_cache'):
         self.dataframe = None
         self.geolocator = Nominatim(user_agent="geoapiExercises_2")
         self.geocode = RateLimiter(self.geolocator.geocode, min_delay_seconds=1)
+        self.geocode_cache_path = geocode_cache_path
 
 
     def get_dataframe(self):
@@ -83,32 +136,23 @@ class DataManager:
         Returns:
         DataFrame: The corrected DataFrame.
         """
-        def remove_accents(text):
-            """
-            Remove accents from a given string using the unidecode library.
-            
-            Parameters:
-            text (str): The string to be processed.
-            
-            Returns:
-            str: The processed string without accents.
-            """
-            if isinstance(text, str):
-                return unidecode(text)
-            else:
-                return text
-        
-        # Iterate over each column in the DataFrame
-        for column in dataframe.columns:
-            # Check if the column contains string values
-            if dataframe[column].dtype == 'object':
-                # Remove accents from all string values in the column
-                dataframe[column] = dataframe[column].apply(remove_accents)
-                # Convert all string values to lowercase
-                dataframe[column] = dataframe[column].str.lower()
-                # Capitalize the first letter of each string value in the column
-                dataframe[column] = dataframe[column].str.capitalize()
-        
+        # Columns containing string values, whether held as object arrays or
+        # as the str/Arrow-backed string dtypes the pyarrow readers return
+        string_columns = [column for column in dataframe.columns if pd.api.types.is_string_dtype(dataframe[column])]
+
+        input_columns = [dataframe[column] for column in string_columns]
+
+        # Columns are independent, so normalize them in parallel; threads are
+        # preferred because the per-row map runs in pandas' C layer
+        normalized_columns = Parallel(n_jobs=-1, prefer='threads')(
+            delayed(_normalize_string_column)(series) for series in input_columns
+        )
+        for column, series, normalized in zip(string_columns, input_columns, normalized_columns):
+            # Already-normalized columns come back as the same object; skip
+            # the redundant reassignment on idempotent reruns
+            if normalized is not series:
+                dataframe[column] = normalized
+
         return dataframe
     
     def geocode_dataframe(self, dataframe=None):
@@ -130,37 +174,45 @@ class DataManager:
 
        
         if 'municipio' in dataframe.columns and 'departamento' in dataframe.columns:
-            # Create a new column for geolocation strings
-            dataframe['geolocalizacion'] = dataframe['municipio'] + ", " + dataframe['departamento'] + ", Colombia"
+            # Create a new column for geolocation strings; concatenating on the
+            # string dtype runs in the Arrow C++ kernel instead of object arrays
+            dataframe['geolocalizacion'] = (
+                dataframe['municipio'].astype('string') + ", " + dataframe['departamento'].astype('string') + ", Colombia"
+            )
             
             # Get unique locations
             location_list = list(dataframe['geolocalizacion'].unique())
 
-            # List to store coordinates
-            out_coordinates = []
-
-            # Geocode each location
-            for location in location_list:
-                geocode_result = self.geocode(location)
-                out_coordinates.append(geocode_result)
-            
-            # Create a list of dictionaries to store location and coordinates
-            location_data = []
-            for i_pos, i_coordinate in enumerate(out_coordinates):
-                dict_value = {}
-                dict_value["location"] = location_list[i_pos]
-                dict_value["latitude"] = i_coordinate.latitude if i_coordinate else None
-                dict_value["longitude"] = i_coordinate.longitude if i_coordinate else None
-                location_data.append(dict_value)
-
-            # Convert list of dictionaries to DataFrame
-            location_df = pd.DataFrame(location_data)
-
-            # Merge coordinates back to the original DataFrame
-            dataframe = dataframe.merge(location_df, left_on='geolocalizacion', right_on='location', how='left')
-            
-            if dataframe is self.dataframe:
-                self.dataframe = dataframe  # Update the managed DataFrame if the input was the managed DataFrame
+            # Resolve coordinates through an on-disk cache so reruns make no network calls
+            with shelve.open(self.geocode_cache_path) as cache:
+                missing_locations = [location for location in location_list if location not in cache]
+
+                # Geocode cache misses concurrently; the shared RateLimiter keeps
+                # the aggregate request rate within Nominatim's 1 req/s policy.
+                # Only successful lookups are cached, so transient failures
+                # (RateLimiter returns None on swallowed errors) are retried
+                # on the next run instead of being remembered as "no coordinates"
+                if missing_locations:
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        for location, geocode_result in zip(missing_locations, executor.map(self.geocode, missing_locations)):
+                            if geocode_result:
+                                cache[location] = (geocode_result.latitude, geocode_result.longitude)
+
+                out_coordinates = [cache.get(location) for location in location_list]
+
+            # Collect coordinates as one list per column so the lookup tables
+            # are built straight from columnar data, without per-row inference
+            latitudes = []
+            longitudes = []
+            for i_coordinate in out_coordinates:
+                latitudes.append(i_coordinate[0] if i_coordinate else None)
+                longitudes.append(i_coordinate[1] if i_coordinate else None)
+
+            # Attach coordinates with a per-row hashtable lookup instead of a full merge
+            lat_map = dict(zip(location_list, latitudes))
+            lon_map = dict(zip(location_list, longitudes))
+            dataframe['latitude'] = dataframe['geolocalizacion'].map(lat_map)
+            dataframe['longitude'] = dataframe['geolocalizacion'].map(lon_map)
 
             return dataframe
         
@@ -173,14 +225,17 @@ class DataManager:
         """
         Saves the managed DataFrame to a CSV file.
         
-        This method attempts to save the DataFrame to a CSV file with the given filename.
-        If an error occurs, it catches the exception and prints an error message.
-        
+        This method attempts to save the DataFrame to a CSV file with the given filename
+        using pyarrow's multithreaded CSV writer, which is much faster than pandas'
+        pure-Python to_csv on large frames. If an error occurs, it catches the
+        exception and prints an error message.
+
         Parameters:
         filename (str): The name of the file to save the DataFrame to.
         """
         try:
-            dataframe.to_csv(filename, index=False)
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            pa.csv.write_csv(table, filename)
             print(f"Data saved to {filename} successfully.")
         except Exception as e:
             print('Error saving data:', e)
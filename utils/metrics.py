@@ -7,19 +7,33 @@ class MetricsComputation:
     A class to perform various metrics computations on a dataset loaded from a CSV file.
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, schema=None):
         """
         Initializes the MetricsComputation instance by loading the data from a CSV file.
 
+        The file is parsed with the multithreaded pyarrow engine and Arrow-backed
+        columns; providing an explicit schema skips the type-inference pass.
+
         Parameters:
         file_path (str): The file path of the CSV file to be loaded.
+        schema (dict, optional): A mapping of column names to dtypes for the parser.
         """
-        self.data = pd.read_csv(file_path)
-        self.data.reset_index(drop=True, inplace=True) 
+        self.data = pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow", dtype=schema)
+        self._reset_cache()
         return
 
     def update_dataframe(self, df):
         self.data = df
+        self._reset_cache()
+        return
+
+    def _reset_cache(self):
+        """
+        Clears the cached per-column statistics after the dataset changes.
+        """
+        self._null_pct = None
+        self._zero_pct = None
+        self._unique_counts = None
         return
 
 
@@ -36,12 +50,22 @@ class MetricsComputation:
         return
 
 
-    def display_info(self):
+    def display_info(self, deep=False):
         """
-        Displays the information of the dataset, including the index dtype and column dtypes, non-null values, and memory usage.
+        Displays the information of the dataset, including the index dtype and column dtypes.
+
+        By default the expensive parts are skipped: per-column non-null counts and
+        deep memory usage both require a full pass over the frame (the latter
+        re-hashes every string). Pass deep=True to include them.
+
+        Parameters:
+        deep (bool): Whether to include non-null counts and deep memory usage. Default is False.
         """
         print('Dataset information:')
-        display(self.data.info())
+        if deep:
+            self.data.info(memory_usage='deep')
+        else:
+            self.data.info(memory_usage=False, show_counts=False)
         print('\n')
         return
 
@@ -57,11 +81,21 @@ class MetricsComputation:
         return
 
 
-    def duplicate_rows(self):
+    def duplicate_rows(self, subset=None):
         """
         Displays the duplicated rows in the dataset.
+
+        Rows are reduced to a single uint64 hash each, so duplicate detection is
+        one pass over the frame, and every member of a duplicate group is shown,
+        not just the repeats after the first.
+
+        Parameters:
+        subset (list, optional): The columns to consider when identifying duplicates.
+                                 Default is all columns.
         """
-        duplicate_rows = self.data[self.data.duplicated()]
+        data = self.data if subset is None else self.data[subset]
+        row_hashes = pd.util.hash_pandas_object(data, index=False)
+        duplicate_rows = self.data.loc[row_hashes.duplicated(keep=False).to_numpy()]
         print('Total of duplicated rows:')
         display(duplicate_rows)
         print('\n')
@@ -72,8 +106,10 @@ class MetricsComputation:
         """
         Displays the percentage of missing values per column in the dataset.
         """
+        if self._null_pct is None:
+            self._null_pct = self.data.isnull().sum(axis=0) / len(self.data) * 100
         print('Percentage missing values per column (%):')
-        display(((self.data.isnull().mean() * 100).round(2)).astype(str) + '%')
+        display(self._null_pct.round(2).astype(str) + '%')
         print('\n')
         return
 
@@ -82,9 +118,12 @@ class MetricsComputation:
         """
         Displays the percentage of zero values per column in the dataset.
         """
+        if self._zero_pct is None:
+            # Only numeric columns can meaningfully compare equal to zero
+            numeric_data = self.data.select_dtypes(include='number')
+            self._zero_pct = (numeric_data == 0).sum(axis=0) / len(self.data) * 100
         print('Percentage zero values per column (%):')
-        zero_percentage = (self.data == 0).mean() * 100
-        display(((zero_percentage).round(2)).astype(str) + '%')
+        display(self._zero_pct.round(2).astype(str) + '%')
         print('\n')
         return
 
@@ -93,11 +132,10 @@ class MetricsComputation:
         """
         Displays the count of unique values per column in the dataset.
         """
-        unique_counts = {}
-        for column in self.data.columns:
-            unique_counts[column] = self.data[column].nunique()
+        if self._unique_counts is None:
+            self._unique_counts = self.data.nunique().to_dict()
         print('Unique values per column:')
-        display(unique_counts)
+        display(self._unique_counts)
         return
     
 
@@ -106,21 +144,19 @@ class MetricsComputation:
         Generates grouped table based on user-defined columns to group by, aggregation functions,
         and column to sort by. Returns the top n records based on the sorted column.
         """
-        # Grouping the data based on user-defined columns 
-        grouped_data = self.data.groupby(group_by_columns).agg(**aggregation_columns).reset_index()
-        
+        # Grouping the data based on user-defined columns; sort=False skips the
+        # internal group sort since nlargest does the ordering below
+        grouped_data = self.data.groupby(group_by_columns, observed=True, sort=False).agg(**aggregation_columns).reset_index()
+
         # Get the names of the aggregation columns from the dictionary
         aggregation_column_names = [key for key in aggregation_columns.keys()]
 
         # Rename the columns of the grouped DataFrame
         grouped_data.columns = group_by_columns + aggregation_column_names
-        
-        # Sorting the data based on the specified column
-        grouped_data = grouped_data.sort_values(by=sort_by_column, ascending=False).reset_index().drop(columns=['index'])
-        
-        # Returning only the top n records
-        top_records = grouped_data.head(top_n)
-        
+
+        # Returning only the top n records via a partial sort
+        top_records = grouped_data.nlargest(top_n, sort_by_column).reset_index(drop=True)
+
         return top_records
     
    
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 from plotly.subplots import make_subplots
@@ -18,6 +19,29 @@ class PlotsMetrics:
         """
         self.data = data
 
+    @property
+    def data(self):
+        """
+        The dataset being visualized. Assigning a new dataset clears the cached statistics.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._null_pct = None
+        self._zero_pct = None
+        self._numeric_cols = None
+        self._corr = None
+
+    def _get_numeric_columns(self):
+        """
+        Returns the numeric columns of the dataset, computing them once per dataset.
+        """
+        if self._numeric_cols is None:
+            self._numeric_cols = self.data.select_dtypes(include='number').columns
+        return self._numeric_cols
+
     def visualize_missing_values(self):
         """
         Visualizes the percentage of missing values for each column in the dataset.
@@ -25,7 +49,9 @@ class PlotsMetrics:
         Returns:
         plotly.graph_objs._figure.Figure: A bar plot showing the percentage of missing values per column.
         """
-        missing_percentage = (self.data.isnull().mean() * 100).sort_values(ascending=False)
+        if self._null_pct is None:
+            self._null_pct = self.data.isnull().sum(axis=0) / len(self.data) * 100
+        missing_percentage = self._null_pct.sort_values(ascending=False)
         fig = px.bar(x=missing_percentage.index, y=missing_percentage.values,
                      labels={'x': 'Columns', 'y': 'Missing Values Percentage'},
                      title='Percentage of Missing Values per Column', color_discrete_sequence=['#EF553B'])
@@ -38,7 +64,11 @@ class PlotsMetrics:
         Returns:
         plotly.graph_objs._figure.Figure: A bar plot showing the percentage of zero values per column.
         """
-        zero_percentage = (self.data == 0).mean() * 100
+        if self._zero_pct is None:
+            # Only numeric columns can meaningfully compare equal to zero
+            numeric_data = self.data.select_dtypes(include='number')
+            self._zero_pct = (numeric_data == 0).sum(axis=0) / len(self.data) * 100
+        zero_percentage = self._zero_pct
         fig = px.bar(x=zero_percentage.index, y=zero_percentage.values,
                      labels={'x': 'Columns', 'y': 'Zero Values Percentage'},
                      title='Percentage of Zero Values per Column', color_discrete_sequence=['#00CC96'])
@@ -65,10 +95,15 @@ class PlotsMetrics:
                
         figures = []
         for column in columns:
-            # Calculate the average production from 'producc_n_t' column
-            avg_production = self.data.groupby(column).agg({'producci_n_t':'mean'}).reset_index()
-            avg_production = avg_production.sort_values(by='producci_n_t', ascending=False).head(10)  # Sort by production
-            
+            # Calculate the average production from 'producc_n_t' column and keep
+            # only the top 10 groups via a partial sort instead of a full one
+            avg_production = (
+                self.data.groupby(column, observed=True, sort=False)['producci_n_t']
+                .mean()
+                .nlargest(10)
+                .reset_index()
+            )
+
             # Create the histogram for each column
             fig = px.bar(avg_production, x=column, y='producci_n_t', title=f'Distribution of mean production for {column}', color_discrete_sequence=['#636EFA'])
             fig.update_yaxes(title_text='Producción promedio')
@@ -81,19 +116,24 @@ class PlotsMetrics:
         """
         Generates a histogram for the specified column in the data.
         If no range is specified, the entire range of the data is used.
+
+        The binning is done in numpy so only the bin counts reach Plotly,
+        instead of shipping every raw value to the browser to be binned there.
         """
-        
-        # Filter the data based on the specified range
-        if range_min is not None and range_max is not None:
-            filtered_data = self.data[(self.data[column] >= range_min) & (self.data[column] <= range_max)][column]
-        else:
-            filtered_data = self.data[column]
 
-        fig = go.Figure(data=[go.Histogram(x=filtered_data, nbinsx=bins)])
+        values = self.data[column].dropna().to_numpy()
+
+        # np.histogram applies the range while binning, so no boolean-mask
+        # copy of the column is materialized
+        hist_range = (range_min, range_max) if range_min is not None and range_max is not None else None
+        counts, edges = np.histogram(values, bins=bins, range=hist_range)
+
+        fig = go.Figure(data=[go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts)])
         fig.update_layout(
         title='Histograma de ' + column,
         xaxis=dict(title='Valores'),
-        yaxis=dict(title='Frecuencia')
+        yaxis=dict(title='Frecuencia'),
+        bargap=0
     )
         fig.show()
 
@@ -108,7 +148,7 @@ class PlotsMetrics:
         """
         
         if columns is None:
-            columns = self.data.select_dtypes(include='number').columns.tolist()
+            columns = self._get_numeric_columns().tolist()
         else:
             # Ensure the specified columns exist in the dataframe
             for col in columns:
@@ -130,10 +170,17 @@ class PlotsMetrics:
         Returns:
         plotly.graph_objs._figure.Figure: A heatmap showing the correlation matrix of numeric columns.
         """
-        numeric_columns = self.data.select_dtypes(include='number').columns
-        corr_matrix = self.data[numeric_columns].corr()
-        
-        fig = go.Figure(data=go.Heatmap(z=corr_matrix.values, x=corr_matrix.index, y=corr_matrix.columns, colorscale='Viridis'))
+        if self._corr is None:
+            numeric_columns = self._get_numeric_columns()
+            # .corr() computes pairwise-complete correlations, so columns with
+            # missing values still correlate against the rest of the frame
+            self._corr = self.data[numeric_columns].corr()
+        corr_matrix = self._corr
+
+        # float32 halves the serialized payload (float16 is rejected by the
+        # plotly serializer); the fixed z-range saves Plotly a scan for the extrema
+        fig = go.Figure(data=go.Heatmap(z=corr_matrix.values.astype(np.float32), x=corr_matrix.index, y=corr_matrix.columns,
+                                        zmin=-1, zmax=1, colorscale='Viridis'))
         fig.update_layout(title='Correlation Matrix')
         return fig
 
@@ -148,11 +195,16 @@ class PlotsMetrics:
         
         for i_col in categ_var:
             fig = make_subplots(specs=[[{'secondary_y': True}]])
-            data_grouped = self.data.groupby(by=i_col).agg({i_col: ['count'], 'producci_n_t': ['mean']}).reset_index()
-            data_grouped.columns = [col[0] if col[1] == '' else col[1] for col in data_grouped.columns]
-            data_grouped = data_grouped.rename(columns={('producci_n_t', 'mean'): 'mean_producci_n_t'}).sort_values(by=('mean_producci_n_t', ''), ascending=True).head(10)
-            fig.add_trace(go.Bar(x=data_grouped[(i_col, i_col)], y=data_grouped[(i_col, 'count')], name='Count'), secondary_y=False)
-            fig.add_trace(go.Scatter(x=data_grouped[(i_col, i_col)], y=data_grouped[('producci_n_t', 'mean')],
+            # Named aggregation reads producci_n_t once and yields flat columns,
+            # so no MultiIndex patching is needed afterwards
+            data_grouped = (
+                self.data.groupby(i_col, observed=True, sort=False)
+                .agg(count=('producci_n_t', 'size'), mean_producci_n_t=('producci_n_t', 'mean'))
+                .nlargest(10, 'mean_producci_n_t')
+                .reset_index()
+            )
+            fig.add_trace(go.Bar(x=data_grouped[i_col], y=data_grouped['count'], name='Count'), secondary_y=False)
+            fig.add_trace(go.Scatter(x=data_grouped[i_col], y=data_grouped['mean_producci_n_t'],
                                      mode='lines', name='Mean producci_n_t'), secondary_y=True)
             fig.update_layout(title=f'Count of {i_col} and Mean producci_n_t',
                               xaxis=dict(title=i_col),
@@ -174,15 +226,15 @@ class PlotsMetrics:
         # Create subplots with secondary y-axis
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
-        # Unique groups of cultivo
-        unique_groups = grouped_data['grupo_de_cultivo'].unique()
-        
+        # Partition the frame once per group of cultivo instead of rescanning
+        # it with a boolean mask on every iteration
+        grouped_by_cultivo = grouped_data.groupby('grupo_de_cultivo', sort=False)
+
         # Assigning colors to unique groups of cultivo
-        colors = px.colors.qualitative.Plotly[:len(unique_groups)]
+        colors = px.colors.qualitative.Plotly[:grouped_by_cultivo.ngroups]
 
         # Iterate over each group of cultivo
-        for group, color in zip(unique_groups, colors):
-            group_data = grouped_data[grouped_data['grupo_de_cultivo'] == group]
+        for (group, group_data), color in zip(grouped_by_cultivo, colors):
 
             # Add bars for count of cultivo (primary y-axis)
             fig.add_trace(